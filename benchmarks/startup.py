@@ -0,0 +1,91 @@
+"""
+Measures the cold start of sherlock's entry points.
+
+Every sample is a fresh interpreter running sherlock's main() for one
+subcommand, up to the point where the subcommand starts its work. RPC
+calls are answered locally and Sherlock.run/post_daily_flag_report are
+no-ops, so nothing hits the network. Wall time and peak memory of the
+whole process are reported.
+
+The numbers exclude anything done inside run() or
+post_daily_flag_report(), so work moved from startup into those methods
+shows up here as a saving even though a real run still pays for it.
+
+The script only relies on main() and those two methods, so it runs
+against older revisions as well:
+
+    $ python3.6 benchmarks/startup.py config.json --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = """
+import json
+import resource
+import sys
+
+from steembase.http_client import HttpClient
+
+RESPONSES = {
+    "get_dynamic_global_properties": {"current_supply": "0.000 STEEM"},
+}
+HttpClient.call = lambda self, name, *args, **kwargs: RESPONSES[name]
+
+from sherlock import sherlock
+
+sherlock.Sherlock.run = lambda self: None
+sherlock.Sherlock.post_daily_flag_report = lambda self: None
+
+sys.argv = ["sherlock"] + sys.argv[1:]
+sherlock.main()
+print(json.dumps(
+    {"max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+SUBCOMMANDS = {
+    "flag-report": ["--post-daily-flag-report", "1"],
+    "run": [],
+}
+
+
+def sample(config, arguments):
+    start = time.perf_counter()
+    output = subprocess.check_output(
+        [sys.executable, "-c", SNIPPET, config] + arguments,
+        cwd=ROOT,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, json.loads(output.decode().splitlines()[-1])["max_rss"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("config", help="Config file in JSON format")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    config = os.path.abspath(args.config)
+
+    for subcommand, arguments in SUBCOMMANDS.items():
+        timings, memory = [], []
+        for _ in range(args.runs):
+            elapsed, max_rss = sample(config, arguments)
+            timings.append(elapsed)
+            memory.append(max_rss)
+
+        print("%-12s median: %.1f ms, min: %.1f ms, median rss: %s KB" % (
+            subcommand,
+            statistics.median(timings) * 1000,
+            min(timings) * 1000,
+            int(statistics.median(memory)),
+        ))
+
+
+if __name__ == '__main__':
+    main()
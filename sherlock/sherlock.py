@@ -2,6 +2,7 @@ import argparse
 import concurrent.futures
 import json
 import logging
+import os
 import threading
 import time
 from datetime import datetime, timedelta
@@ -49,6 +50,104 @@ class memoized:
         return _memoized
 
 
+class lazy_property:
+    """Computes the value on first access and stores it on the instance."""
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.func.__name__] = value
+        return value
+
+
+def read_file(path):
+    with open(path) as f:
+        return f.read()
+
+
+def parse_timeframe(timeframe):
+    try:
+        start, end = map(int, timeframe.split("-"))
+    except (AttributeError, ValueError):
+        raise ValueError(
+            "Invalid timeframe: %r. Expected a value like '12-24'." %
+            timeframe)
+    return start, end
+
+
+def load_config(path, flag_report=False):
+    """Loads and validates the config for the subcommand about to run.
+
+    Only the keys and template files the subcommand actually uses are
+    checked, so a report-only config doesn't need the bot's templates.
+    """
+    config = json.loads(read_file(path))
+
+    required = ["nodes", "posting_key", "bot_account"]
+    if flag_report:
+        required.append("flag_report_options")
+    else:
+        required += ["timeframe", "comment_template", "main_post_template"]
+
+    for key in required:
+        if not config.get(key):
+            raise ValueError("%s is required in the config." % key)
+
+    for key in ("flag_options", "flag_report_options",
+                "self_voter_report_options"):
+        if config.get(key) and not isinstance(config[key], dict):
+            raise ValueError("%s must be an object." % key)
+
+    if flag_report:
+        options = config["flag_report_options"]
+        for key in ("title", "post_template"):
+            if not options.get(key):
+                raise ValueError(
+                    "flag_report_options.%s is required." % key)
+        templates = [options["post_template"]]
+    else:
+        templates = [
+            config["comment_template"],
+            config["main_post_template"],
+        ]
+        if config.get("reply_template"):
+            templates.append(config["reply_template"])
+        if config.get("self_voter_report_options"):
+            options = config["self_voter_report_options"]
+            if not options.get("post_template"):
+                raise ValueError(
+                    "self_voter_report_options.post_template is required.")
+            templates.append(options["post_template"])
+
+    for template in templates:
+        if not template or not os.path.isfile(template):
+            raise ValueError("Template file not found: %s" % template)
+
+    if not flag_report:
+        parse_timeframe(config["timeframe"])
+        if config.get("suspicious_users") and \
+                config.get("suspicious_users_timeframe"):
+            parse_timeframe(config["suspicious_users_timeframe"])
+
+    return config
+
+
+def get_keys(config, flag_report=False):
+    keys = [config.get("posting_key")]
+    # the flag report only posts as the bot, it doesn't need the
+    # flagger's key.
+    if not flag_report and config.get("flag_options") and \
+            'from_account_posting_key' in config.get("flag_options"):
+        keys.append(config["flag_options"]["from_account_posting_key"])
+
+    return keys
+
+
 class Sherlock:
 
     def __init__(self, steemd_instance, config):
@@ -57,17 +156,12 @@ class Sherlock:
         self.start_block = config.get("start_block") or None
         self.timeframe = config.get("timeframe")
         self.minimum_vote_value = config.get("minimum_vote_value")
-        self.comment_template = open(config.get("comment_template")).read()
-        if config.get("reply_template"):
-            self.reply_template = open(config.get("reply_template")).read()
-        else:
-            self.reply_template = None
-        self.thread_pool = concurrent.futures.ThreadPoolExecutor(
-            max_workers=config.get("threads"))
+        self.comment_template_path = config.get("comment_template")
+        self.reply_template_path = config.get("reply_template")
+        self.threads = config.get("threads")
         self.main_post_title = config.get("main_post_title")
         self.main_post_tags = config.get("main_post_tags")
-        self.main_post_template = open(
-            config.get("main_post_template")).read()
+        self.main_post_template_path = config.get("main_post_template")
         self.flag_options = config.get("flag_options")
         self.suspicious_users = config.get("suspicious_users")
         self.suspicious_users_timeframe = config.get(
@@ -81,6 +175,39 @@ class Sherlock:
         self.flag_report_options = config.get(
             "flag_report_options")
 
+    @lazy_property
+    def timeframe_range(self):
+        return parse_timeframe(self.timeframe)
+
+    @lazy_property
+    def suspicious_users_timeframe_range(self):
+        if not self.suspicious_users_timeframe:
+            return None
+        return parse_timeframe(self.suspicious_users_timeframe)
+
+    @lazy_property
+    def comment_template(self):
+        return read_file(self.comment_template_path)
+
+    @lazy_property
+    def reply_template(self):
+        if not self.reply_template_path:
+            return None
+        return read_file(self.reply_template_path)
+
+    @lazy_property
+    def main_post_template(self):
+        return read_file(self.main_post_template_path)
+
+    @lazy_property
+    def flag_report_template(self):
+        return read_file(self.flag_report_options.get("post_template"))
+
+    @lazy_property
+    def thread_pool(self):
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.threads)
+
     def url(self, p):
         return "https://steemit.com/@%s/%s" % (
             p.get("author"), p.get("permlink"))
@@ -102,7 +229,7 @@ class Sherlock:
         try:
             self.steemd_instance.commit.post(
                 post_title,
-                open(self.self_voter_report_options.get("post_template")).read(),
+                read_file(self.self_voter_report_options.get("post_template")),
                 self.bot_account,
                 tags=self.self_voter_report_options.get("tags"),
                 permlink=permlink,
@@ -168,8 +295,7 @@ class Sherlock:
                 flag.get("comments"),
                 str(round(flag.get("total_removed"), 2)).replace("-", ""),
             )
-        template = open(options.get("post_template")).read()
-        body = template.format(
+        body = self.flag_report_template.format(
             total_amount=str(total_amount).replace("-", ""),
             incidents=incidents
         )
@@ -282,11 +408,10 @@ class Sherlock:
     def vote_abused(self, post, vote_created_at):
         diff = post["cashout_time"] - vote_created_at
         diff_in_hours = float(diff.total_seconds()) / float(3600)
-        timeframe = list(map(int, self.timeframe.split("-")))
-        if self.suspicious_users and self.suspicious_users_timeframe:
+        timeframe = self.timeframe_range
+        if self.suspicious_users and self.suspicious_users_timeframe_range:
             if post.get("author") in self.suspicious_users:
-                timeframe = list(map(
-                    int, self.suspicious_users_timeframe.split("-")))
+                timeframe = self.suspicious_users_timeframe_range
 
         return timeframe[0] < diff_in_hours < timeframe[1]
 
@@ -625,24 +750,23 @@ def main():
     parser.add_argument("config", help="Config file in JSON format")
     parser.add_argument("--post-daily-flag-report", help="Posts daily flag report")
     args = parser.parse_args()
-    config = json.loads(open(args.config).read())
-
-    keys = [config.get("posting_key")]
-    if config.get("flag_options") and \
-            'from_account_posting_key' in config.get("flag_options"):
-        keys.append(config["flag_options"]["from_account_posting_key"])
+    flag_report = bool(args.post_daily_flag_report)
 
+    try:
+        config = load_config(args.config, flag_report=flag_report)
+    except ValueError as e:
+        parser.error(e)
 
     steemd_instance = Steem(
         nodes=config["nodes"],
-        keys=keys,
+        keys=get_keys(config, flag_report=flag_report),
     )
 
     sherlock = Sherlock(
         steemd_instance,
         config,
     )
-    if args.post_daily_flag_report:
+    if flag_report:
         sherlock.post_daily_flag_report()
         return
 
@@ -0,0 +1,191 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from sherlock.sherlock import Sherlock, get_keys, load_config, \
+    parse_timeframe
+
+
+@pytest.fixture
+def config(tmp_path):
+    templates = {}
+    for name in ("comment", "post", "reply", "flag_report"):
+        path = tmp_path / ("%s_template.md" % name)
+        path.write_text("{body}")
+        templates[name] = str(path)
+
+    return {
+        "nodes": ["https://api.steemit.com"],
+        "posting_key": "posting_wif",
+        "bot_account": "turbot",
+        "timeframe": "12-24",
+        "comment_template": templates["comment"],
+        "main_post_template": templates["post"],
+        "reply_template": templates["reply"],
+        "flag_options": {
+            "from_account": "flagger_account",
+            "from_account_posting_key": "flagger_account_posting_key",
+        },
+        "suspicious_users_timeframe": "12-72",
+        "flag_report_options": {
+            "title": "Daily Flag Report ({date})",
+            "post_template": templates["flag_report"],
+        },
+    }
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    def _write_config(config):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(config))
+        return str(path)
+    return _write_config
+
+
+@pytest.mark.parametrize("flag_report", [False, True])
+def test_load_config(config, write_config, flag_report):
+    assert load_config(
+        write_config(config), flag_report=flag_report) == config
+
+
+@pytest.mark.parametrize("flag_report, key", [
+    (False, "nodes"),
+    (False, "posting_key"),
+    (False, "bot_account"),
+    (False, "timeframe"),
+    (False, "comment_template"),
+    (False, "main_post_template"),
+    (True, "nodes"),
+    (True, "posting_key"),
+    (True, "bot_account"),
+    (True, "flag_report_options"),
+])
+def test_load_config_missing_key(config, write_config, flag_report, key):
+    del config[key]
+    with pytest.raises(ValueError, match=key):
+        load_config(write_config(config), flag_report=flag_report)
+
+
+@pytest.mark.parametrize("key", ["title", "post_template"])
+def test_load_config_missing_flag_report_option(config, write_config, key):
+    del config["flag_report_options"][key]
+    with pytest.raises(ValueError, match=key):
+        load_config(write_config(config), flag_report=True)
+
+
+def test_load_config_flag_report_ignores_bot_options(config, write_config):
+    for key in ("timeframe", "comment_template", "main_post_template"):
+        del config[key]
+    config["suspicious_users"] = ["trafalgar"]
+    config["suspicious_users_timeframe"] = "12h-72h"
+    config["reply_template"] = "/does/not/exist.md"
+
+    assert load_config(write_config(config), flag_report=True) == config
+
+
+@pytest.mark.parametrize("flag_report, key", [
+    (False, "comment_template"),
+    (False, "main_post_template"),
+    (False, "reply_template"),
+])
+def test_load_config_missing_template(config, write_config, flag_report, key):
+    config[key] = "/does/not/exist.md"
+    with pytest.raises(ValueError, match="Template file not found"):
+        load_config(write_config(config), flag_report=flag_report)
+
+
+def test_load_config_missing_flag_report_template(config, write_config):
+    config["flag_report_options"]["post_template"] = "/does/not/exist.md"
+    with pytest.raises(ValueError, match="Template file not found"):
+        load_config(write_config(config), flag_report=True)
+
+
+def test_load_config_missing_self_voter_template(config, write_config):
+    config["self_voter_report_options"] = {"title": "Self Voters ({date})"}
+    with pytest.raises(
+            ValueError,
+            match="self_voter_report_options.post_template is required"):
+        load_config(write_config(config))
+
+
+@pytest.mark.parametrize("flag_report, key", [
+    (False, "flag_options"),
+    (False, "self_voter_report_options"),
+    (True, "flag_report_options"),
+])
+def test_load_config_options_not_an_object(
+        config, write_config, flag_report, key):
+    config[key] = ["not", "an", "object"]
+    with pytest.raises(ValueError, match="%s must be an object" % key):
+        load_config(write_config(config), flag_report=flag_report)
+
+
+def test_load_config_bad_timeframe(config, write_config):
+    config["timeframe"] = "12h-24h"
+    with pytest.raises(ValueError, match="Invalid timeframe"):
+        load_config(write_config(config))
+
+
+def test_load_config_bad_suspicious_users_timeframe(config, write_config):
+    config["suspicious_users_timeframe"] = "12h-72h"
+    # ignored unless there are suspicious users to apply it to.
+    assert load_config(write_config(config)) == config
+
+    config["suspicious_users"] = ["trafalgar"]
+    with pytest.raises(ValueError, match="Invalid timeframe"):
+        load_config(write_config(config))
+
+
+@pytest.mark.parametrize("timeframe", ["12-24-36", 12, "a-b", "12", None])
+def test_parse_timeframe_invalid(timeframe):
+    with pytest.raises(ValueError, match="Invalid timeframe"):
+        parse_timeframe(timeframe)
+
+
+def test_parse_timeframe():
+    assert parse_timeframe("12-24") == (12, 24)
+
+
+def test_get_keys(config):
+    assert get_keys(config) == [
+        "posting_wif", "flagger_account_posting_key"]
+
+
+def test_get_keys_flag_report(config):
+    assert get_keys(config, flag_report=True) == ["posting_wif"]
+
+
+def test_get_keys_without_flag_options(config):
+    del config["flag_options"]
+    assert get_keys(config) == ["posting_wif"]
+
+
+def test_sherlock_without_bot_templates(config):
+    config["comment_template"] = "/does/not/exist.md"
+    config["main_post_template"] = "/does/not/exist.md"
+    config["reply_template"] = "/does/not/exist.md"
+    config["timeframe"] = "12h-24h"
+
+    sherlock = Sherlock(None, config)
+    assert sherlock.flag_report_template == "{body}"
+    with pytest.raises(FileNotFoundError):
+        sherlock.comment_template
+
+
+@pytest.mark.parametrize("author, hours_before_payout, abused", [
+    ("turbot", 18, True),
+    ("turbot", 30, False),
+    ("turbot", 6, False),
+    ("trafalgar", 30, True),
+    ("trafalgar", 80, False),
+])
+def test_vote_abused(config, author, hours_before_payout, abused):
+    config["suspicious_users"] = ["trafalgar"]
+    sherlock = Sherlock(None, config)
+    cashout_time = datetime(2018, 1, 2)
+    post = {"author": author, "cashout_time": cashout_time}
+    vote_created_at = cashout_time - timedelta(hours=hours_before_payout)
+
+    assert sherlock.vote_abused(post, vote_created_at) is abused